@@ -16,27 +16,32 @@ import argparse
 import json
 import os
 import sys
+import threading
 import requests
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
 
-# Notion integration (optional)
-NOTION_ENABLED = False
-NOTION_CLIENT = None
-NOTION_DB_ID = None
-
+# Fast JSON encoding (optional - falls back to stdlib json)
 try:
-    from notion_client import Client
-    API_KEY = os.environ.get('NOTION_API_KEY')
-    if API_KEY:
-        NOTION_CLIENT = Client(auth=API_KEY)
-        NOTION_ENABLED = True
+    import orjson
 except ImportError:
-    pass
+    orjson = None
+
+# Reusable stdlib encoders (compact for files/Notion, indented for stdout)
+_COMPACT_ENCODE = json.JSONEncoder(separators=(',', ':')).encode
+_PRETTY_ENCODE = json.JSONEncoder(indent=2).encode
+
+# Notion integration (optional - notion_client is imported on first save)
+NOTION_API_KEY = os.environ.get('NOTION_API_KEY')
+NOTION_ENABLED = bool(NOTION_API_KEY)
+NOTION_CLIENT = None
+NOTION_DB_ID = None
 
 # Data storage paths
 DATA_DIR = Path(__file__).parent.parent / 'data' / 'market-intel'
-DATA_DIR.mkdir(parents=True, exist_ok=True)
+_DATA_DIR_READY = False
 
 # Amadeus client (optional - set AMADEUS_API_KEY env var)
 try:
@@ -48,6 +53,9 @@ except ImportError:
     AMADEUS_AVAILABLE = False
     AmadeusClient = None
 
+_AMADEUS = None
+_AMADEUS_LOCK = threading.Lock()
+
 # Key routes to monitor (Mexico-focused - starting from Guadalajara)
 ROUTES = {
     'GDL-CUN': {'origin': 'GDL', 'destination': 'CUN', 'name': 'Guadalajara → Cancún'},
@@ -61,10 +69,36 @@ ROUTES = {
 # Currency pairs to track
 CURRENCIES = ['USD', 'EUR', 'GBP']
 
+# History files, resolved once at import
+ROUTE_FILES = {route_id: DATA_DIR / f'flights_{route_id}.jsonl' for route_id in ROUTES}
+EXCHANGE_FILES = {f'MXN-{currency}': DATA_DIR / f'exchange_MXN-{currency}.json' for currency in CURRENCIES}
+
 # Exchange rate API
 EXCHANGERATE_API_KEY = os.environ.get('EXCHANGERATE_API_KEY')
 EXCHANGERATE_URL = os.environ.get('EXCHANGERATE_URL', 'https://v6.exchangerate-api.com/v6')
 
+def _ensure_data_dir():
+    """Create the data directory on the first write of this process."""
+    global _DATA_DIR_READY
+    if not _DATA_DIR_READY:
+        DATA_DIR.mkdir(parents=True, exist_ok=True)
+        _DATA_DIR_READY = True
+
+
+def _json_dumps(obj):
+    """Encode obj as compact JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _COMPACT_ENCODE(obj).encode()
+
+
+def _json_loads(data):
+    """Decode JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
 # Load Notion database ID
 def load_notion_db_id():
     """Load Notion database ID from config file."""
@@ -82,6 +116,15 @@ else:
     NOTION_ENABLED = False
 
 
+def _amadeus():
+    """Return the shared Amadeus client, creating it on first use."""
+    global _AMADEUS
+    with _AMADEUS_LOCK:
+        if _AMADEUS is None:
+            _AMADEUS = AmadeusClient()
+        return _AMADEUS
+
+
 def get_flight_prices(origin, destination, departure_date):
     """Get current flight prices from Amadeus."""
     if not AMADEUS_AVAILABLE:
@@ -99,8 +142,7 @@ def get_flight_prices(origin, destination, departure_date):
         return mock_prices.get(route_key, [100.0, 120.0, 150.0, 180.0, 200.0])
 
     try:
-        client = AmadeusClient()
-        response = client.search_flights(
+        response = _amadeus().search_flights(
             origin=origin,
             destination=destination,
             departure_date=departure_date,
@@ -121,65 +163,233 @@ def get_flight_prices(origin, destination, departure_date):
         return []
 
 
-def store_price_data(route_id, prices, data_type='flights'):
-    """Store price data with timestamp."""
-    date_str = datetime.now().strftime('%Y-%m-%d')
-    timestamp = datetime.now().isoformat()
+def migrate_legacy_history(file_path):
+    """Convert a legacy per-date ``.json`` history file into JSONL (one-time)."""
+    legacy_path = file_path.with_suffix('.json')
+    if file_path.exists():
+        return
 
-    file_path = DATA_DIR / f'{data_type}_{route_id}.json'
-    existing_data = {}
+    try:
+        legacy_data = _json_loads(legacy_path.read_bytes())
+    except FileNotFoundError:
+        return
 
-    if file_path.exists():
-        with open(file_path, 'r') as f:
-            existing_data = json.load(f)
+    with open(file_path, 'wb') as f:
+        for date_str, entries in legacy_data.items():
+            for entry in entries:
+                f.write(_json_dumps({'date': date_str, **entry}) + b'\n')
 
-    if date_str not in existing_data:
-        existing_data[date_str] = []
+    print(f"Migrated {legacy_path.name} to {file_path.name}", file=sys.stderr)
 
-    existing_data[date_str].append({
+
+def iter_price_history(file_path):
+    """Yield stored price records from a JSONL history file, oldest first."""
+    migrate_legacy_history(file_path)
+    try:
+        lines = file_path.read_bytes().splitlines()
+    except FileNotFoundError:
+        return
+
+    for line in lines:
+        if line.strip():
+            yield _json_loads(line)
+
+
+def tail_price_history(file_path, days, block_size=1 << 16):
+    """Return records covering at least the last `days` dates of a JSONL history.
+
+    The file is read backwards in blocks, so the cost depends on the window
+    rather than on the length of the history.
+    """
+    migrate_legacy_history(file_path)
+    try:
+        f = open(file_path, 'rb')
+    except FileNotFoundError:
+        return []
+
+    records = []
+    with f:
+        pos = f.seek(0, os.SEEK_END)
+        partial = b''
+        while pos > 0:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + partial).splitlines()
+
+            # Unless we reached the start of the file, the first line may be cut
+            partial = lines.pop(0) if pos > 0 and lines else b''
+            records[:0] = [_json_loads(line) for line in lines if line.strip()]
+
+            if len({rec['date'] for rec in records}) > days:
+                break
+
+    return records
+
+
+def _summarize_prices(prices):
+    """Return (count, total, min, max) of prices in a single pass."""
+    count = 0
+    total = 0.0
+    low = high = None
+    for price in prices:
+        count += 1
+        total += price
+        if low is None or price < low:
+            low = price
+        if high is None or price > high:
+            high = price
+    return count, total, low, high
+
+
+def _rollup_path(file_path):
+    """Path of the daily rollup that sits next to a JSONL history file."""
+    return file_path.with_name(f'{file_path.stem}_rollup.json')
+
+
+def _add_to_rollup(rollup, date_str, prices):
+    """Fold a price sample into the {n, sum, min, max} aggregate for its day."""
+    count, total, low, high = _summarize_prices(prices)
+    if not count:
+        return
+
+    day = rollup.get(date_str)
+    if day is None:
+        rollup[date_str] = {'n': count, 'sum': total, 'min': low, 'max': high}
+    else:
+        day['n'] += count
+        day['sum'] += total
+        day['min'] = min(day['min'], low)
+        day['max'] = max(day['max'], high)
+
+
+def load_price_rollup(file_path):
+    """Load daily price aggregates, rebuilding them from the history if missing."""
+    rollup_path = _rollup_path(file_path)
+    try:
+        return _json_loads(rollup_path.read_bytes())
+    except FileNotFoundError:
+        pass
+
+    rollup = {}
+    for rec in iter_price_history(file_path):
+        _add_to_rollup(rollup, rec['date'], rec['prices'])
+
+    if rollup:
+        with open(rollup_path, 'wb') as f:
+            f.write(_json_dumps(rollup))
+
+    return rollup
+
+
+def store_price_data(route_id, prices, data_type='flights'):
+    """Append a price sample to the route's JSONL history and daily rollup."""
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d')
+    timestamp = now.isoformat()
+
+    if data_type == 'flights' and route_id in ROUTE_FILES:
+        file_path = ROUTE_FILES[route_id]
+    else:
+        file_path = DATA_DIR / f'{data_type}_{route_id}.jsonl'
+    rollup = load_price_rollup(file_path)
+
+    count, total, low, high = _summarize_prices(prices)
+    entry = {
         'timestamp': timestamp,
         'prices': prices,
-        'avg_price': sum(prices) / len(prices) if prices else None,
-        'min_price': min(prices) if prices else None,
-        'max_price': max(prices) if prices else None,
-    })
+        'avg_price': total / count if count else None,
+        'min_price': low,
+        'max_price': high,
+    }
+
+    _ensure_data_dir()
+    with open(file_path, 'ab', buffering=1 << 16) as f:
+        f.write(_json_dumps({'date': date_str, **entry}) + b'\n')
+
+    _add_to_rollup(rollup, date_str, prices)
+    with open(_rollup_path(file_path), 'wb') as f:
+        f.write(_json_dumps(rollup))
+
+    return entry
 
-    with open(file_path, 'w') as f:
-        json.dump(existing_data, f, indent=2)
 
-    return existing_data[date_str][-1]
+# Notion limits each rich_text element to 2000 characters
+NOTION_TEXT_LIMIT = 2000
+
+
+def _rich_text(content):
+    """Build a rich_text value, splitting content that exceeds Notion's limit."""
+    return [
+        {'text': {'content': content[i:i + NOTION_TEXT_LIMIT]}}
+        for i in range(0, len(content), NOTION_TEXT_LIMIT)
+    ] or [{'text': {'content': ''}}]
+
+
+# Invariant Notion property values, shared by every page built below
+_TYPE_DAILY_FLIGHTS = {'select': {'name': 'Daily Flights'}}
+_TYPE_EXCHANGE_RATE = {'select': {'name': 'Exchange Rate'}}
+_TYPE_WEEKLY_REPORT = {'select': {'name': 'Weekly Report'}}
+
+
+def _title(content):
+    """Build a title property value."""
+    return {'title': [{'text': {'content': content}}]}
+
+
+def _make_flight_props(date_str, results):
+    """Build the Daily Flights page properties for one day's results."""
+    # Summary across routes; per-route detail is kept in Report Data
+    avg_prices = [r['data']['avg_price'] for r in results if r['data']['avg_price']]
+    min_prices = [r['data']['min_price'] for r in results if r['data']['min_price']]
+    max_prices = [r['data']['max_price'] for r in results if r['data']['max_price']]
+
+    return {
+        'Name': _title(f"{date_str} - Daily Flights"),
+        'Type': _TYPE_DAILY_FLIGHTS,
+        'Route': {'multi_select': [{'name': r['route']} for r in results]},
+        'Avg Price': {'number': round(sum(avg_prices) / len(avg_prices), 2) if avg_prices else None},
+        'Min Price': {'number': round(min(min_prices), 2) if min_prices else None},
+        'Max Price': {'number': round(max(max_prices), 2) if max_prices else None},
+        'Report Data': {'rich_text': _rich_text(_json_dumps(results).decode())},
+    }
+
+
+def _make_exchange_props(date_str, results):
+    """Build the Exchange Rate page properties for one day's results."""
+    return {
+        'Name': _title(f"{date_str} - Exchange Rates"),
+        'Type': _TYPE_EXCHANGE_RATE,
+        'Currency Pair': {'multi_select': [{'name': r['pair']} for r in results]},
+        'Report Data': {'rich_text': _rich_text(_json_dumps(results).decode())},
+    }
+
+
+def _notion_client():
+    """Return the Notion client, importing notion_client on first use."""
+    global NOTION_CLIENT
+    if NOTION_CLIENT is None:
+        from notion_client import Client
+        NOTION_CLIENT = Client(auth=NOTION_API_KEY)
+    return NOTION_CLIENT
+
+
+def _create_page(properties):
+    """Create a single page in the market intelligence database."""
+    return _notion_client().pages.create(
+        parent={'database_id': NOTION_DB_ID},
+        properties=properties
+    )
 
 
 def save_daily_prices_to_notion(results):
-    """Save daily flight prices to Notion."""
-    if not NOTION_ENABLED or not NOTION_DB_ID:
+    """Save the day's flight prices for all routes to a single Notion page."""
+    if not NOTION_ENABLED or not NOTION_DB_ID or not results:
         return
 
     try:
         date_str = datetime.now().strftime('%Y-%m-%d')
-
-        for result in results:
-            route_id = result['route']
-            data = result['data']
-
-            properties = {
-                'Name': {
-                    'title': [
-                        {'text': {'content': f"{date_str} - Daily Flights - {route_id}"}}
-                    ]
-                },
-                'Type': {'select': {'name': 'Daily Flights'}},
-                'Route': {'multi_select': [{'name': route_id}]},
-                'Avg Price': {'number': round(data['avg_price'], 2) if data['avg_price'] else None},
-                'Min Price': {'number': round(data['min_price'], 2) if data['min_price'] else None},
-                'Max Price': {'number': round(data['max_price'], 2) if data['max_price'] else None},
-                'Report Data': {'rich_text': [{'text': {'content': json.dumps(data, indent=2)}}]},
-            }
-
-            NOTION_CLIENT.pages.create(
-                parent={'database_id': NOTION_DB_ID},
-                properties=properties
-            )
+        _create_page(_make_flight_props(date_str, results))
 
         print(f"Saved {len(results)} flight entries to Notion", file=sys.stderr)
     except Exception as e:
@@ -187,33 +397,13 @@ def save_daily_prices_to_notion(results):
 
 
 def save_exchange_to_notion(results):
-    """Save exchange rates to Notion."""
-    if not NOTION_ENABLED or not NOTION_DB_ID:
+    """Save the day's exchange rates for all pairs to a single Notion page."""
+    if not NOTION_ENABLED or not NOTION_DB_ID or not results:
         return
 
     try:
         date_str = datetime.now().strftime('%Y-%m-%d')
-
-        for result in results:
-            pair = result['pair']
-            data = result['data']
-
-            properties = {
-                'Name': {
-                    'title': [
-                        {'text': {'content': f"{date_str} - Exchange Rates - {pair}"}}
-                    ]
-                },
-                'Type': {'select': {'name': 'Exchange Rate'}},
-                'Currency Pair': {'multi_select': [{'name': pair}]},
-                'Exchange Rate': {'number': round(data['rate'], 4)},
-                'Report Data': {'rich_text': [{'text': {'content': json.dumps(data, indent=2)}}]},
-            }
-
-            NOTION_CLIENT.pages.create(
-                parent={'database_id': NOTION_DB_ID},
-                properties=properties
-            )
+        _create_page(_make_exchange_props(date_str, results))
 
         print(f"Saved {len(results)} exchange entries to Notion", file=sys.stderr)
     except Exception as e:
@@ -236,22 +426,15 @@ def save_weekly_report_to_notion(report):
         insights_text = '\n'.join(report['insights']) if report['insights'] else 'No significant insights'
 
         properties = {
-            'Name': {
-                'title': [
-                    {'text': {'content': f"{date_str} - Weekly Report"}}
-                ]
-            },
-            'Type': {'select': {'name': 'Weekly Report'}},
+            'Name': _title(f"{date_str} - Weekly Report"),
+            'Type': _TYPE_WEEKLY_REPORT,
             'Route': {'multi_select': routes} if routes else None,
             'Currency Pair': {'multi_select': currencies} if currencies else None,
-            'Insights': {'rich_text': [{'text': {'content': insights_text}}]},
-            'Report Data': {'rich_text': [{'text': {'content': json.dumps(report, indent=2)}}]},
+            'Insights': {'rich_text': _rich_text(insights_text)},
+            'Report Data': {'rich_text': _rich_text(_json_dumps(report).decode())},
         }
 
-        NOTION_CLIENT.pages.create(
-            parent={'database_id': NOTION_DB_ID},
-            properties=properties
-        )
+        _create_page(properties)
 
         print("Saved weekly report to Notion", file=sys.stderr)
     except Exception as e:
@@ -265,10 +448,20 @@ def track_flights(save_to_notion=False):
     results = []
     departure_date = (datetime.now() + timedelta(days=30)).strftime('%Y-%m-%d')
 
+    # Requests are network-bound, so fan them out across routes
+    with ThreadPoolExecutor(max_workers=len(ROUTES)) as executor:
+        futures = {
+            route_id: executor.submit(
+                get_flight_prices, route_info['origin'], route_info['destination'], departure_date
+            )
+            for route_id, route_info in ROUTES.items()
+        }
+
+    # Store sequentially, in route order, once all requests have finished
     for route_id, route_info in ROUTES.items():
         print(f"  {route_info['name']}...")
 
-        prices = get_flight_prices(route_info['origin'], route_info['destination'], departure_date)
+        prices = futures[route_id].result()
 
         if prices:
             result = store_price_data(route_id, prices, 'flights')
@@ -332,25 +525,28 @@ def track_exchange(save_to_notion=False):
             'MXN-GBP': 21.50,
         }
 
+    now = datetime.now()
+    date_str = now.strftime('%Y-%m-%d')
+    timestamp = now.isoformat()
+
     results = []
     for pair, rate in rates.items():
         result = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': timestamp,
             'rate': rate,
         }
 
-        file_path = DATA_DIR / f'exchange_{pair}.json'
-        existing_data = {}
-
-        if file_path.exists():
-            with open(file_path, 'r') as f:
-                existing_data = json.load(f)
+        file_path = EXCHANGE_FILES[pair]
+        try:
+            existing_data = _json_loads(file_path.read_bytes())
+        except FileNotFoundError:
+            existing_data = {}
 
-        date_str = datetime.now().strftime('%Y-%m-%d')
         existing_data[date_str] = result
 
-        with open(file_path, 'w') as f:
-            json.dump(existing_data, f, indent=2)
+        _ensure_data_dir()
+        with open(file_path, 'wb') as f:
+            f.write(_json_dumps(existing_data))
 
         results.append({
             'pair': pair,
@@ -368,8 +564,11 @@ def generate_weekly_report(days=7, save_to_notion=False):
     """Generate weekly market intelligence report."""
     print("Generating weekly report...")
 
+    now = datetime.now()
+    cutoff_date = (now - timedelta(days=days)).strftime('%Y-%m-%d')
+
     report = {
-        'generated_at': datetime.now().isoformat(),
+        'generated_at': now.isoformat(),
         'period_days': days,
         'flights': {},
         'exchange': {},
@@ -378,74 +577,64 @@ def generate_weekly_report(days=7, save_to_notion=False):
 
     # Analyze flight trends
     for route_id in ROUTES.keys():
-        file_path = DATA_DIR / f'flights_{route_id}.json'
-        if not file_path.exists():
-            continue
-
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-
-        # Get recent days
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        recent_data = {
-            date: entries for date, entries in data.items()
-            if date >= cutoff_date
-        }
+        file_path = ROUTE_FILES[route_id]
+
+        # Walk the daily rollup newest first and stop at the cutoff
+        rollup = load_price_rollup(file_path)
+        oldest = latest = None
+        for date in reversed(rollup):
+            if date < cutoff_date:
+                break
+            if latest is None:
+                latest = rollup[date]
+            oldest = rollup[date]
+
+        if latest is not None:
+            latest_avg = latest['sum'] / latest['n']
+            oldest_avg = oldest['sum'] / oldest['n']
+
+            trend = latest_avg - oldest_avg
+            trend_pct = (trend / oldest_avg * 100) if oldest_avg else 0
+
+            report['flights'][route_id] = {
+                'name': ROUTES[route_id]['name'],
+                'latest_avg': latest_avg,
+                'oldest_avg': oldest_avg,
+                'trend': trend,
+                'trend_pct': round(trend_pct, 2),
+                'latest_min': latest['min'],
+            }
 
-        if recent_data:
-            all_avg_prices = []
-            for entries in recent_data.values():
-                for entry in entries:
-                    if entry['avg_price']:
-                        all_avg_prices.append(entry['avg_price'])
-
-            if all_avg_prices:
-                latest = list(recent_data.values())[-1][-1]
-                oldest = list(recent_data.values())[0][0]
-
-                trend = latest['avg_price'] - oldest['avg_price']
-                trend_pct = (trend / oldest['avg_price'] * 100) if oldest['avg_price'] else 0
-
-                report['flights'][route_id] = {
-                    'name': ROUTES[route_id]['name'],
-                    'latest_avg': latest['avg_price'],
-                    'oldest_avg': oldest['avg_price'],
-                    'trend': trend,
-                    'trend_pct': round(trend_pct, 2),
-                    'latest_min': latest['min_price'],
-                }
-
-                # Generate insight
-                if trend_pct < -10:
-                    report['insights'].append(
-                        f"🔥 OFERTA: {ROUTES[route_id]['name']} bajó {abs(trend_pct):.1f}% "
-                        f"(${latest['avg_price']:.0f} USD)"
-                    )
-                elif trend_pct > 15:
-                    report['insights'].append(
-                        f"⚠️ PRECIOS ALTOS: {ROUTES[route_id]['name']} subió {trend_pct:.1f}% "
-                        f"(${latest['avg_price']:.0f} USD)"
-                    )
+            # Generate insight
+            if trend_pct < -10:
+                report['insights'].append(
+                    f"🔥 OFERTA: {ROUTES[route_id]['name']} bajó {abs(trend_pct):.1f}% "
+                    f"(${latest_avg:.0f} USD)"
+                )
+            elif trend_pct > 15:
+                report['insights'].append(
+                    f"⚠️ PRECIOS ALTOS: {ROUTES[route_id]['name']} subió {trend_pct:.1f}% "
+                    f"(${latest_avg:.0f} USD)"
+                )
 
     # Analyze exchange rates
     for currency in CURRENCIES:
         pair = f'MXN-{currency}'
-        file_path = DATA_DIR / f'exchange_{pair}.json'
-        if not file_path.exists():
+        file_path = EXCHANGE_FILES[pair]
+        try:
+            data = _json_loads(file_path.read_bytes())
+        except FileNotFoundError:
             continue
 
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        oldest = latest = None
+        for date in reversed(data):
+            if date < cutoff_date:
+                break
+            if latest is None:
+                latest = data[date]
+            oldest = data[date]
 
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        recent_data = {
-            date: entry for date, entry in data.items()
-            if date >= cutoff_date
-        }
-
-        if recent_data:
-            latest = recent_data[list(recent_data.keys())[-1]]
-            oldest = recent_data[list(recent_data.keys())[0]]
+        if latest is not None:
 
             report['exchange'][pair] = {
                 'latest': latest['rate'],
@@ -534,33 +723,38 @@ def main():
     if args.command == 'track':
         if args.type == 'flights':
             results = track_flights(save_to_notion=args.notion)
-            print(json.dumps(results, indent=2))
+            print(_PRETTY_ENCODE(results))
         else:
             results = track_exchange(save_to_notion=args.notion)
-            print(json.dumps(results, indent=2))
+            print(_PRETTY_ENCODE(results))
 
     elif args.command == 'report':
         report = generate_weekly_report(days=args.days, save_to_notion=args.notion)
         if args.format == 'telegram':
             print(format_telegram_report(report))
         else:
-            print(json.dumps(report, indent=2))
+            print(_PRETTY_ENCODE(report))
 
     elif args.command == 'analyze':
-        file_path = DATA_DIR / f'flights_{args.route}.json'
-        if not file_path.exists():
+        file_path = ROUTE_FILES[args.route]
+
+        # History is chronological, so keep only the last 7 days while streaming
+        recent_days = deque(maxlen=7)
+        for rec in tail_price_history(file_path, 7):
+            if recent_days and recent_days[-1][0] == rec['date']:
+                recent_days[-1][1].append(rec)
+            else:
+                recent_days.append((rec['date'], [rec]))
+
+        if not recent_days:
             print(f"No data found for route {args.route}", file=sys.stderr)
             sys.exit(1)
 
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-
         print(f"\n{ROUTES[args.route]['name']}\n")
         print(f"{'Date':<12} {'Avg':<10} {'Min':<10} {'Max':<10}")
         print("-" * 42)
 
-        for date in sorted(data.keys(), reverse=True)[:7]:
-            entries = data[date]
+        for date, entries in reversed(recent_days):
             for entry in entries:
                 if entry['avg_price']:
                     print(f"{date:<12} ${entry['avg_price']:<9.2f} "